@@ -349,6 +349,15 @@ class _Filter(ABC):
         name_attribute = _Attribute(name="sys/name", type="string")
         return _Filter.eq(name_attribute, name)
 
+    @staticmethod
+    def name_in(*names: str) -> "_Filter":
+        """Match runs or experiments whose name equals any of the provided names."""
+        if not names:
+            raise ValueError("At least one name must be provided.")
+        if len(names) == 1:
+            return _Filter.name_eq(names[0])
+        return _Filter.any([_Filter.name_eq(name) for name in names])
+
     @abc.abstractmethod
     def to_query(self) -> str: ...
 
@@ -12,8 +12,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from dataclasses import dataclass
-from typing import NewType
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    NewType,
+)
 
 ProjectIdentifier = NewType("ProjectIdentifier", str)  # e.g. "team/john.doe"
 SysId = NewType("SysId", str)  # e.g. "KEY-1234"
@@ -25,6 +31,18 @@ CustomRunId = NewType("CustomRunId", str)  # an uuid
 class RunIdentifier:
     project_identifier: ProjectIdentifier
     sys_id: SysId
+    # Identifiers are used as dict keys on hot paths, so the hash is computed once on construction
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.project_identifier, self.sys_id)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # String hashes are salted per process, so the cached hash must not be pickled
+        return self.__class__, (self.project_identifier, self.sys_id)
 
     def __str__(self) -> str:
         return f"{self.project_identifier}/{self.sys_id}"
@@ -40,3 +58,13 @@ class AttributeDefinition:
 class RunAttributeDefinition:
     run_identifier: RunIdentifier
     attribute_definition: AttributeDefinition
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.run_identifier, self.attribute_definition)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (self.run_identifier, self.attribute_definition)
@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import operator
 import pathlib
 from dataclasses import dataclass
 from typing import (
@@ -236,48 +237,36 @@ def create_metrics_dataframe(
         if run_attr_definition.attribute_definition.name not in path_mapping:
             path_mapping[run_attr_definition.attribute_definition.name] = len(path_mapping)
 
-    def generate_categorized_rows() -> Generator[Tuple, None, None]:
-        for attribute, points in metrics_data.items():
-            exp_category = sys_id_mapping[attribute.run_identifier.sys_id]
-            path_category = path_mapping[attribute.attribute_definition.name]
-
-            for point in points:
-                # Only include columns that we know we need. Note that the list of columns must match the
-                # the list of `types` below.
-                head = (
-                    exp_category,
-                    path_category,
-                    point[StepIndex],
-                    point[ValueIndex],
-                )
-                if include_point_previews and timestamp_column_name:
-                    tail: Tuple[Any, ...] = (
-                        point[TimestampIndex],
-                        point[IsPreviewIndex],
-                        point[PreviewCompletionIndex],
-                    )
-                elif timestamp_column_name:
-                    tail = (point[TimestampIndex],)
-                elif include_point_previews:
-                    tail = (point[IsPreviewIndex], point[PreviewCompletionIndex])
-                else:
-                    tail = ()
-
-                yield head + tail
-
     types = [
         (index_column_name, "uint32"),
         ("path", "uint32"),
         ("step", "float64"),
         ("value", "float64"),
     ]
+    # Only include columns that we know we need. Note that the list of point indices must match the
+    # list of `types`.
+    point_indices = [StepIndex, ValueIndex]
 
     if timestamp_column_name:
         types.append((timestamp_column_name, "int64"))
+        point_indices.append(TimestampIndex)
 
     if include_point_previews:
         types.append(("is_preview", "bool"))
         types.append(("preview_completion", "float64"))
+        point_indices.extend((IsPreviewIndex, PreviewCompletionIndex))
+
+    # The column selection is resolved once here, so the per-point loop below does not branch on the options
+    extract_point_columns = operator.itemgetter(*point_indices)
+
+    def generate_categorized_rows() -> Generator[Tuple, None, None]:
+        for attribute, points in metrics_data.items():
+            head = (
+                sys_id_mapping[attribute.run_identifier.sys_id],
+                path_mapping[attribute.attribute_definition.name],
+            )
+            for point in points:
+                yield head + extract_point_columns(point)
 
     df = pd.DataFrame(
         np.fromiter(generate_categorized_rows(), dtype=types),
@@ -37,7 +37,14 @@ def split_attribute_filters(
         else:
             return [_attribute_filter]
     elif isinstance(_attribute_filter, filters._AttributeFilterAlternative):
-        return list(it.chain.from_iterable(split_attribute_filters(child) for child in _attribute_filter.filters))
+        # Each filter is fetched with a separate query, so equal alternatives would only repeat the same requests
+        split_filters: list[filters._AttributeFilter] = []
+        for split_filter in it.chain.from_iterable(
+            split_attribute_filters(child) for child in _attribute_filter.filters
+        ):
+            if split_filter not in split_filters:
+                split_filters.append(split_filter)
+        return split_filters
     else:
         raise RuntimeError(f"Unexpected filter type: {type(_attribute_filter)}")
 
@@ -15,6 +15,7 @@
 import hashlib
 import mimetypes
 import pathlib
+import threading
 from dataclasses import dataclass
 from typing import (
     Literal,
@@ -48,6 +49,8 @@ from ..retrieval import retry
 
 logger = get_logger()
 
+_thread_local_storage = threading.local()
+
 
 @dataclass(frozen=True)
 class SignedFile:
@@ -187,26 +190,42 @@ def _download_file_requests(
     target_path: pathlib.Path,
     timeout: Optional[int] = env.NEPTUNE_QUERY_FILES_TIMEOUT.get(),
 ) -> DownloadResult:
-    try:
-        response = requests.get(signed_file.url, stream=True, timeout=timeout)
-        response.raise_for_status()
-        with open(target_path, mode="wb") as file:
-            for chunk in response.iter_content(chunk_size=4 * 1024 * 1024):
-                file.write(chunk)
-        return DownloadResult(status="success")
-    except requests.exceptions.HTTPError as e:
+    # Closing the response returns its connection to the session's pool on both the success and the error path
+    with _get_requests_session().get(signed_file.url, stream=True, timeout=timeout) as response:
         try:
-            if target_path.exists():
-                target_path.unlink()
-        except OSError:
-            pass
-
-        if e.response.status_code == 404:
-            return DownloadResult(status="not_found", status_code=e.response.status_code, content=e.response.content)
-        elif e.response.status_code == 400:
-            return DownloadResult(status="expired", status_code=e.response.status_code, content=e.response.content)
-        else:
-            return DownloadResult(status="transient", status_code=e.response.status_code, content=e.response.content)
+            response.raise_for_status()
+            with open(target_path, mode="wb") as file:
+                for chunk in response.iter_content(chunk_size=4 * 1024 * 1024):
+                    file.write(chunk)
+            return DownloadResult(status="success")
+        except requests.exceptions.HTTPError:
+            try:
+                if target_path.exists():
+                    target_path.unlink()
+            except OSError:
+                pass
+
+            if response.status_code == 404:
+                return DownloadResult(status="not_found", status_code=response.status_code, content=response.content)
+            elif response.status_code == 400:
+                return DownloadResult(status="expired", status_code=response.status_code, content=response.content)
+            else:
+                return DownloadResult(status="transient", status_code=response.status_code, content=response.content)
+
+
+def _get_requests_session() -> requests.Session:
+    """
+    Returns a requests session owned by the calling thread, so download workers reuse connections across files.
+    requests.Session is not guaranteed to be thread-safe, hence one per thread.
+
+    The session is never closed explicitly. It lives as long as its thread: download_files runs downloads on
+    its own thread pool, so the sessions and their idle connections are released when that pool shuts down.
+    """
+    session: Optional[requests.Session] = getattr(_thread_local_storage, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local_storage.session = session
+    return session
 
 
 def download_file_complete(
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import functools as ft
+import operator
 from typing import (
     Any,
     Optional,
@@ -50,6 +51,16 @@ FloatPointValue = tuple[int, float, float, bool, float]
 
 TOTAL_POINT_LIMIT: int = 1_000_000
 
+# Extracts all fields of a ProtoPointValueDTO into a FloatPointValue in a single C-level call,
+# avoiding per-field attribute lookups in the Python interpreter
+_point_to_float_point_value = operator.attrgetter(
+    "timestamp_millis",
+    "step",
+    "value",
+    "is_preview",
+    "completion_ratio",
+)
+
 
 def fetch_multiple_series_values(
     client: AuthenticatedClient,
@@ -63,6 +74,9 @@ def fetch_multiple_series_values(
     if not run_attribute_definitions:
         return {}
 
+    # Duplicated definitions would be requested, and their points accumulated, more than once
+    run_attribute_definitions = list(dict.fromkeys(run_attribute_definitions))
+
     assert len(run_attribute_definitions) <= TOTAL_POINT_LIMIT, (
         f"The number of requested attributes {len(run_attribute_definitions)} exceeds the maximum limit of "
         f"{TOTAL_POINT_LIMIT}. Please reduce the number of attributes."
@@ -148,16 +162,7 @@ def _process_metrics_page(
     result = {}
     for series in data.series:
         run_attribute = request_id_to_attribute[series.requestId]
-        result[run_attribute] = [
-            (
-                point.timestamp_millis,
-                point.step,
-                point.value,
-                point.is_preview,
-                point.completion_ratio,
-            )
-            for point in series.series.values
-        ]
+        result[run_attribute] = list(map(_point_to_float_point_value, series.series.values))
     return util.Page(items=list(result.items()))
 
 
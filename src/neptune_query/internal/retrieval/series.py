@@ -60,7 +60,8 @@ def fetch_series_values(
     if not run_attribute_definitions:
         return {}
 
-    run_attribute_definitions = list(run_attribute_definitions)
+    # Duplicated definitions would be requested, and their values accumulated, more than once
+    run_attribute_definitions = list(dict.fromkeys(run_attribute_definitions))
     width = len(str(len(run_attribute_definitions) - 1))
     request_id_to_run_attr_definition: dict[str, RunAttributeDefinition] = {
         f"{ix:0{width}d}": pair for ix, pair in enumerate(run_attribute_definitions)
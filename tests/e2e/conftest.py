@@ -46,18 +46,22 @@ def pytest_configure(config):
             random_suffix = "".join(random.choices(string.ascii_lowercase, k=6))
             execution_id = f"{timestamp}_{random_suffix}"
         config.neptune_test_execution_id = execution_id
+        # Unlike the execution ID, which may be reused across runs, this always identifies the current session
+        config.neptune_test_session_id = "".join(random.choices(string.ascii_lowercase + string.digits, k=12))
     else:
         # Worker: get from worker input
         config.neptune_test_execution_id = config.workerinput["__neptune_test_execution_id"]
+        config.neptune_test_session_id = config.workerinput["__neptune_test_session_id"]
 
 
 def pytest_configure_node(node):
     """
     Controller hook: called for each worker being created.
-    Share the test execution ID with the worker.
+    Share the test execution ID and the session ID with the worker.
     """
-    # Send the already-generated value to each worker
+    # Send the already-generated values to each worker
     node.workerinput["__neptune_test_execution_id"] = node.config.neptune_test_execution_id
+    node.workerinput["__neptune_test_session_id"] = node.config.neptune_test_session_id
 
 
 @pytest.fixture(scope="session")
@@ -73,6 +77,11 @@ def test_execution_id(request) -> str:
     return request.config.neptune_test_execution_id
 
 
+@pytest.fixture(scope="session")
+def test_session_id(request) -> str:
+    return request.config.neptune_test_session_id
+
+
 @pytest.fixture(scope="session")
 def workspace() -> str:
     value = os.getenv("NEPTUNE_E2E_WORKSPACE")
@@ -115,29 +124,44 @@ class EnsureProjectFunction:
     See ensure_project fixture docstring for usage details.
     """
 
-    def __init__(self, client: AuthenticatedClient, api_token: str, workspace: str, test_execution_id: str):
+    def __init__(
+        self,
+        client: AuthenticatedClient,
+        api_token: str,
+        workspace: str,
+        test_execution_id: str,
+        test_session_id: str,
+    ):
         self.client = client
         self.api_token = api_token
         self.workspace = workspace
         self.test_execution_id = test_execution_id
+        self.test_session_id = test_session_id
+        # Module-scoped project fixtures are set up again whenever xdist interleaves tests from different modules.
+        # The project name identifies the defining fixture, so its data is the same on every call.
+        self._ingested_projects: dict[str, IngestedProjectData] = {}
 
     def __call__(self, project_data: ProjectData) -> IngestedProjectData:
         caller_frame = inspect.currentframe().f_back
         caller_module = inspect.getmodule(caller_frame)
         caller_module_name = caller_module.__name__
         caller_fn_name = caller_frame.f_code.co_name
+        project_name = f"pye2e__{self.test_execution_id}__{caller_module_name}.{caller_fn_name}"
 
-        return ingest_project(
-            client=self.client,
-            api_token=self.api_token,
-            workspace=self.workspace,
-            project_name=f"pye2e__{self.test_execution_id}__{caller_module_name}.{caller_fn_name}",
-            project_data=project_data,
-        )
+        if project_name not in self._ingested_projects:
+            self._ingested_projects[project_name] = ingest_project(
+                client=self.client,
+                api_token=self.api_token,
+                workspace=self.workspace,
+                project_name=project_name,
+                project_data=project_data,
+                session_id=self.test_session_id,
+            )
+        return self._ingested_projects[project_name]
 
 
 @pytest.fixture(scope="session")
-def ensure_project(client, api_token, workspace, test_execution_id) -> EnsureProjectFunction:
+def ensure_project(client, api_token, workspace, test_execution_id, test_session_id) -> EnsureProjectFunction:
     """Fixture returning a function-like object that can be used to create or retrieve projects with specified data.
 
     Arguments for the returned callable:
@@ -164,4 +188,4 @@ def ensure_project(client, api_token, workspace, test_execution_id) -> EnsurePro
                     ],
                 ))
     """
-    return EnsureProjectFunction(client, api_token, workspace, test_execution_id)
+    return EnsureProjectFunction(client, api_token, workspace, test_execution_id, test_session_id)
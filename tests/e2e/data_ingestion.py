@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import (
     dataclass,
     field,
@@ -11,7 +13,10 @@ from datetime import (
     timezone,
 )
 from pathlib import Path
-from time import sleep
+from time import (
+    monotonic,
+    sleep,
+)
 from typing import (
     Generator,
     Iterable,
@@ -23,6 +28,7 @@ from typing import (
 import filelock
 import neptune_scale
 import neptune_scale.types
+from neptune_scale.sync.metadata_splitter import Metrics
 
 from neptune_query.generated.neptune_api import AuthenticatedClient
 from neptune_query.internal.identifiers import ProjectIdentifier
@@ -37,20 +43,30 @@ SeriesPoint = TypeVar("SeriesPoint", str, float, IngestionHistogram, IngestionFi
 
 _STEP0_TIMESTAMP = 1_700_000_000.0  # Arbitrary fixed timestamp for ingestion start
 
+_MAX_CONCURRENT_RUNS = 16  # Upper bound on the number of runs ingested at the same time
+
+_INGESTION_WAIT_TIMEOUT = 40.0  # Seconds to wait for ingested runs to become visible
+_INGESTION_POLL_INITIAL_DELAY = 0.1
+_INGESTION_POLL_MAX_DELAY = 2.0
 
+
+@functools.lru_cache(maxsize=8192)
 def step_to_timestamp(step: float) -> datetime:
     """
     Converts a step number to a fixed timestamp for testing purposes.
+    Results are cached, as the same steps are converted for every run and every expected value in tests.
 
     Don't rely on this. The behavior of this function may change in the future.
     """
     return datetime.fromtimestamp(_STEP0_TIMESTAMP + step, tz=timezone.utc)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class RunData:
     """
     Definition of the data to be ingested for a run in tests.
+
+    Compared by identity: field-wise equality would deep-compare all series dicts.
     """
 
     experiment_name: str | None = None
@@ -116,7 +132,10 @@ class IngestedProjectData:
 def _wait_for_ingestion(
     client: AuthenticatedClient, project_identifier: ProjectIdentifier, expected_data: ProjectData
 ) -> None:
-    for attempt in range(20):
+    deadline = monotonic() + _INGESTION_WAIT_TIMEOUT
+    delay = _INGESTION_POLL_INITIAL_DELAY
+
+    while True:
         found_runs = 0
 
         for page in search.fetch_run_sys_ids(
@@ -129,8 +148,12 @@ def _wait_for_ingestion(
         if found_runs == len(expected_data.runs):
             return
 
-        # Next attempt in 2 seconds, please
-        sleep(2)
+        if monotonic() >= deadline:
+            break
+
+        # Freshly ingested data usually shows up quickly, so start polling often and back off gradually
+        sleep(delay)
+        delay = min(delay * 1.7, _INGESTION_POLL_MAX_DELAY)
 
     raise RuntimeError(
         f"Timed out waiting for data ingestion, " f"found runs: {found_runs} out of expected: {len(expected_data.runs)}"
@@ -144,33 +167,45 @@ def ingest_project(
     workspace: str,
     project_name: str,
     project_data: ProjectData,
+    session_id: str,
 ) -> IngestedProjectData:
     """
     Ensures that a project with the specified data exists in Neptune.
     If the project does not exist, it is created and the data is ingested.
     Uses a file lock to prevent concurrent creation/ingestion of the same project.
+    A marker file next to the lock records completed ingestion for other processes of the same test session.
 
     workspace: The Neptune workspace/organization name where the project should be created.
+    session_id: Identifier of the current test session, shared by all its workers.
+        Markers of earlier sessions are ignored, as their projects may have been deleted since.
     """
     project_identifier = f"{workspace}/{project_name}"
-
     lock_path = Path(tempfile.gettempdir()) / f"neptune_e2e__{workspace}__{project_name}.lock"
-    with filelock.FileLock(str(lock_path), timeout=300):
-        if not _project_exists(client, project_identifier):
-            response = client.get_httpx_client().request(
-                method="post",
-                url="/api/backend/v1/projects",
-                json={"organizationIdentifier": workspace, "name": project_name, "visibility": "priv"},
-            )
-            response.raise_for_status()
+    marker_path = lock_path.with_name(f"{lock_path.stem}__{session_id}.ingested")
+
+    # The project becomes visible as soon as it is created, long before its data is ingested,
+    # so its existence is only checked under the lock. Without the lock, only the marker is trusted,
+    # as it is written after ingestion has completed.
+    if not marker_path.exists():
+        with filelock.FileLock(str(lock_path), timeout=300):
+            if not _project_exists(client, project_identifier):
+                response = client.get_httpx_client().request(
+                    method="post",
+                    url="/api/backend/v1/projects",
+                    json={"organizationIdentifier": workspace, "name": project_name, "visibility": "priv"},
+                )
+                response.raise_for_status()
 
-            _ingest_project_data(
-                api_token=api_token,
-                project_identifier=project_identifier,
-                project_data=project_data,
-            )
+                _ingest_project_data(
+                    api_token=api_token,
+                    project_identifier=project_identifier,
+                    project_data=project_data,
+                )
+
+                _wait_for_ingestion(client=client, project_identifier=project_identifier, expected_data=project_data)
 
-            _wait_for_ingestion(client=client, project_identifier=project_identifier, expected_data=project_data)
+            # Under the lock, an existing project is one whose ingestion has completed
+            marker_path.touch()
 
     return IngestedProjectData(
         project_identifier=project_identifier,
@@ -201,19 +236,41 @@ def _ingest_project_data(api_token: str, project_identifier, project_data: Proje
 
 
 def _ingest_runs(runs_data: list[RunData], api_token: str, project_identifier: str) -> None:
-    runs = []
-    for run_data in runs_data:
-        run = neptune_scale.Run(
-            api_token=api_token,
-            project=project_identifier,
-            experiment_name=run_data.experiment_name,
-            run_id=run_data.run_id,
-            fork_run_id=run_data.fork_point[0] if run_data.fork_point else None,
-            fork_step=run_data.fork_point[1] if run_data.fork_point else None,
-            enable_console_log_capture=False,
-            source_tracking_config=None,
-        )
+    # Runs within a batch don't depend on each other, so their network-bound ingestion can be overlapped.
+    # The last created run of an experiment becomes its head, so runs sharing an experiment are still
+    # ingested one after another, in list order.
+    run_sequences = _group_runs_by_experiment(runs_data)
+    ingest_run_sequence = functools.partial(
+        _ingest_run_sequence, api_token=api_token, project_identifier=project_identifier
+    )
+    with ThreadPoolExecutor(max_workers=min(len(run_sequences), _MAX_CONCURRENT_RUNS)) as executor:
+        list(executor.map(ingest_run_sequence, run_sequences))
+
 
+def _ingest_run_sequence(runs_data: list[RunData], api_token: str, project_identifier: str) -> None:
+    for run_data in runs_data:
+        _ingest_run(run_data, api_token=api_token, project_identifier=project_identifier)
+
+
+def _ingest_run(run_data: RunData, api_token: str, project_identifier: str) -> None:
+    all_steps = _get_all_steps(run_data)
+    float_series_by_step = _get_series_by_step(run_data.float_series)
+    string_series_by_step = _get_series_by_step(run_data.string_series)
+    histogram_series_by_step = _get_series_by_step(run_data.histogram_series)
+    file_series_by_step = _get_series_by_step(run_data.file_series)
+
+    # Closing waits for the data to be synced, so it happens in the worker, overlapping with other runs.
+    # The context manager also closes the run when logging fails, so its background processes don't leak.
+    with neptune_scale.Run(
+        api_token=api_token,
+        project=project_identifier,
+        experiment_name=run_data.experiment_name,
+        run_id=run_data.run_id,
+        fork_run_id=run_data.fork_point[0] if run_data.fork_point else None,
+        fork_step=run_data.fork_point[1] if run_data.fork_point else None,
+        enable_console_log_capture=False,
+        source_tracking_config=None,
+    ) as run:
         if run_data.configs:
             run.log_configs(run_data.configs)
 
@@ -223,48 +280,29 @@ def _ingest_runs(runs_data: list[RunData], api_token: str, project_identifier: s
         if run_data.files:
             run.assign_files(run_data.files)
 
-        all_steps = _get_all_steps(run_data)
-        float_series_by_step = _get_series_by_step(run_data.float_series)
-        string_series_by_step = _get_series_by_step(run_data.string_series)
-        histogram_series_by_step = _get_series_by_step(run_data.histogram_series)
-        file_series_by_step = _get_series_by_step(run_data.file_series)
-
         for step in all_steps:
-            timestamp = step_to_timestamp(step)
-            if data := float_series_by_step[step]:
-                run.log_metrics(
-                    step=step,
-                    data=data,
-                    timestamp=timestamp,
-                )
-
+            # A single _log call per step creates one operation instead of separate ones for metrics and other series.
+            # Series kinds without a value at this step are passed as None, so the SDK skips them altogether.
+            metrics = float_series_by_step.get(step)
             run._log(
                 step=step,
-                timestamp=timestamp,
-                string_series=string_series_by_step[step],
-                histograms=histogram_series_by_step[step],
-                file_series=file_series_by_step[step],
+                timestamp=step_to_timestamp(step),
+                metrics=Metrics(data=metrics) if metrics else None,
+                string_series=string_series_by_step.get(step),
+                histograms=histogram_series_by_step.get(step),
+                file_series=file_series_by_step.get(step),
             )
 
-        runs.append(run)
-
-    for run in runs:
-        run.close()
-
 
 def _get_all_steps(run_data: RunData) -> Iterable[float]:
-    # Collect all unique steps
-    all_steps = set()
-    for series in run_data.float_series.values():
-        all_steps.update(series.keys())
-    for series in run_data.string_series.values():
-        all_steps.update(series.keys())
-    for series in run_data.histogram_series.values():
-        all_steps.update(series.keys())
-    for series in run_data.file_series.values():
-        all_steps.update(series.keys())
-
-    return sorted(all_steps)
+    # Collect all unique steps with a single set union over all series
+    all_series = (
+        run_data.float_series,
+        run_data.string_series,
+        run_data.histogram_series,
+        run_data.file_series,
+    )
+    return sorted(set().union(*(series.keys() for series_group in all_series for series in series_group.values())))
 
 
 def _get_series_by_step(series: dict[str, dict[float, SeriesPoint]]) -> Mapping[float, dict[str, SeriesPoint]]:
@@ -277,6 +315,20 @@ def _get_series_by_step(series: dict[str, dict[float, SeriesPoint]]) -> Mapping[
     return series_by_step
 
 
+def _group_runs_by_experiment(runs_data: list[RunData]) -> list[list[RunData]]:
+    runs_by_experiment: dict[str, list[RunData]] = {}
+    run_sequences: list[list[RunData]] = []
+    for run in runs_data:
+        if run.experiment_name is None:
+            run_sequences.append([run])
+        elif run.experiment_name in runs_by_experiment:
+            runs_by_experiment[run.experiment_name].append(run)
+        else:
+            runs_by_experiment[run.experiment_name] = [run]
+            run_sequences.append(runs_by_experiment[run.experiment_name])
+    return run_sequences
+
+
 def _group_runs_by_execution_order(runs_data: list[RunData]) -> Generator[list[RunData], None, None]:
     if not runs_data:
         return
@@ -290,13 +342,17 @@ def _group_runs_by_execution_order(runs_data: list[RunData]) -> Generator[list[R
     resolved: set[Optional[str]] = {None}  # None represents a parent of root runs
 
     while remaining:
-        ready_batch = [run for run in remaining if parent_id(run) in resolved]
+        # Partition in a single pass; removing runs one by one would be quadratic and compare whole dataclasses
+        ready_batch: list[RunData] = []
+        pending: list[RunData] = []
+        for run in remaining:
+            (ready_batch if parent_id(run) in resolved else pending).append(run)
+
         if not ready_batch:
             raise ValueError("Detected cyclic or unresolved fork dependencies among runs to ingest.")
 
-        for run in ready_batch:
-            remaining.remove(run)
-            resolved.add(run.run_id)
+        remaining = pending
+        resolved.update(run.run_id for run in ready_batch)
 
         yield ready_batch
 
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import (
+    Callable,
+    Sequence,
+)
 from dataclasses import dataclass
 from datetime import (
     datetime,
     timezone,
 )
+from operator import attrgetter
 from typing import Literal
 
 import numpy as np
@@ -30,6 +34,9 @@ pytestmark = pytest.mark.filterwarnings("ignore:.*fetch_.*_table.*:neptune_query
 
 CONFLICTING_ATTRIBUTE_PATH = "conflict/shared"
 
+_by_experiment_name = attrgetter("experiment_name")
+_by_name = attrgetter("name")
+
 
 # This test is for a function that searches across multiple projects.
 #
@@ -82,11 +89,10 @@ def test_fetch_experiments_table_respects_sort_direction(
         sort_direction=sort_direction,
     )
 
-    expected_experiments = sorted(
-        _experiment_heads_sorted_by_name([project_1, project_2]),
-        key=lambda e: e.experiment_name,
-        reverse=(sort_direction == "desc"),
-    )
+    expected_experiments = _experiment_heads_sorted_by_name([project_1, project_2])
+    if sort_direction == "desc":
+        # Experiment names are unique, so reversing the ascending order is the same as sorting in descending order
+        expected_experiments.reverse()
     expected_dataframe = _expected_dataframe(
         experiments=expected_experiments,
         columns=[Column(name="config/int", type="config")],
@@ -128,7 +134,7 @@ def test_fetch_experiments_table_filters_by_name_list(project_1, project_2, uniq
     )
 
     expected_dataframe = _expected_dataframe(
-        experiments=sorted(selected_experiments, key=lambda e: e.experiment_name),
+        experiments=sorted(selected_experiments, key=_by_experiment_name),
         columns=[
             Column(name="config/int", type="config"),
             Column(name="metrics/loss", type="float_series"),
@@ -219,7 +225,7 @@ def test_fetch_experiments_table_conflicting_attributes_with_type_suffix(project
     )
 
     expected_dataframe = _expected_dataframe(
-        experiments=sorted(experiments_with_conflict, key=lambda e: e.experiment_name),
+        experiments=sorted(experiments_with_conflict, key=_by_experiment_name),
         columns=[
             Column(name=f"{CONFLICTING_ATTRIBUTE_PATH}:float_series", type="float_series"),
             Column(name=f"{CONFLICTING_ATTRIBUTE_PATH}:string", type="config"),
@@ -470,23 +476,15 @@ def _experiment_heads_sorted_by_name(
             experiment_heads_in_project[run.experiment_name] = run
         experiment_heads.extend(experiment_heads_in_project.values())
 
-    return sorted(experiment_heads, key=lambda head: head.experiment_name)
+    return sorted(experiment_heads, key=_by_experiment_name)
 
 
-def _experiment_base_name(experiment_name: str) -> str:
-    return experiment_name.rsplit("__", 1)[0]
-
-
-def _experiment_head_by_name(project: IngestedProjectData, experiment_base_name: str) -> IngestedRunData:
-    head: IngestedRunData | None = None
-    for run in project.ingested_runs:
-        if run.experiment_name == experiment_base_name:
-            head = run
-    if head is None:
-        raise ValueError(
-            f"Experiment head '{experiment_base_name}' not found in project '{project.project_identifier}'."
-        )
-    return head
+def _experiment_head_by_name(project: IngestedProjectData, experiment_name: str) -> IngestedRunData:
+    # The head is the last run ingested for the experiment, so search from the end and stop at the first match
+    for run in reversed(project.ingested_runs):
+        if run.experiment_name == experiment_name:
+            return run
+    raise ValueError(f"Experiment head '{experiment_name}' not found in project '{project.project_identifier}'.")
 
 
 def _expected_dataframe(
@@ -495,29 +493,32 @@ def _expected_dataframe(
     columns: Sequence[Column],
 ) -> pd.DataFrame:
     if columns:
-        ordered_columns = sorted(columns, key=lambda item: item.name)
-        data = {
-            column.name: [_extract_column_value(head, column) for head in experiments] for column in ordered_columns
-        }
+        ordered_columns = sorted(columns, key=_by_name)
+        data = {column.name: list(map(_column_value_extractor(column), experiments)) for column in ordered_columns}
         columns_index = pd.Index([column.name for column in ordered_columns], name="attribute")
     else:
         data = {}
         columns_index = pd.Index([], name="attribute")
 
-    index = pd.MultiIndex.from_tuples(
-        [(run.project_identifier, run.experiment_name) for run in experiments],
+    index = pd.MultiIndex.from_arrays(
+        [[run.project_identifier for run in experiments], [run.experiment_name for run in experiments]],
         names=["project", "experiment"],
     )
 
     return pd.DataFrame(data=data, index=index, columns=columns_index)
 
 
-def _extract_column_value(run: IngestedRunData, column: Column) -> str | int | float:
+def _column_value_extractor(column: Column) -> Callable[[IngestedRunData], str | int | float]:
+    # Resolved once per column, so the name parsing and type dispatch don't repeat for every cell
     attribute_path = column.name.split(":", 1)[0]  # Remove type suffix if present
     if column.type == "config":
-        return run.configs.get(attribute_path, np.nan)
+        return lambda run: run.configs.get(attribute_path, np.nan)
     if column.type == "float_series":
-        if (series := run.float_series.get(attribute_path, None)) is not None:
-            return series[max(series)]  # Return the last value in the float series
-        return np.nan
+        return lambda run: _last_series_value(run.float_series.get(attribute_path, None))
     raise ValueError(f"Unsupported column type '{column.type}'.")
+
+
+def _last_series_value(series: dict[float, float] | None) -> float:
+    if series is not None:
+        return series[max(series)]  # Return the last value in the float series
+    return np.nan
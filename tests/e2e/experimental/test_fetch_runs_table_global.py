@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import (
+    Callable,
+    Sequence,
+)
 from dataclasses import dataclass
 from datetime import (
     datetime,
     timezone,
 )
+from operator import attrgetter
 from typing import Literal
 
 import numpy as np
@@ -30,6 +34,9 @@ pytestmark = pytest.mark.filterwarnings("ignore:.*fetch_.*_table.*:neptune_query
 
 CONFLICTING_ATTRIBUTE_PATH = "conflict/shared"
 
+_by_experiment_name = attrgetter("experiment_name")
+_by_name = attrgetter("name")
+
 
 # This test is for a function that searches across multiple projects.
 #
@@ -82,7 +89,7 @@ def test_fetch_runs_table_respects_sort_direction(
 
     expected_runs = sorted(
         _all_runs_sorted_by_name([project_1, project_2]),
-        key=lambda run: run.experiment_name,
+        key=_by_experiment_name,
         reverse=(sort_direction == "desc"),
     )
 
@@ -211,7 +218,7 @@ def test_fetch_runs_table_conflicting_attributes_with_type_suffix(project_1, pro
     )
 
     expected_dataframe = _expected_dataframe(
-        runs=sorted(runs_with_conflict, key=lambda run: run.experiment_name),
+        runs=sorted(runs_with_conflict, key=_by_experiment_name),
         columns=[
             Column(name=f"{CONFLICTING_ATTRIBUTE_PATH}:float_series", type="float_series"),
             Column(name=f"{CONFLICTING_ATTRIBUTE_PATH}:string", type="config"),
@@ -406,7 +413,7 @@ def project_2(ensure_project: EnsureProjectFunction, unique_magic_string: str) -
 
 
 def _all_runs_sorted_by_name(projects: Sequence[IngestedProjectData]) -> list[IngestedRunData]:
-    return sorted([run for project in projects for run in project.ingested_runs], key=lambda run: run.experiment_name)
+    return sorted([run for project in projects for run in project.ingested_runs], key=_by_experiment_name)
 
 
 def _expected_dataframe(
@@ -415,8 +422,8 @@ def _expected_dataframe(
     columns: Sequence[Column],
 ) -> pd.DataFrame:
     if columns:
-        ordered_columns = sorted(columns, key=lambda item: item.name)
-        data = {column.name: [_extract_column_value(run, column) for run in runs] for column in ordered_columns}
+        ordered_columns = sorted(columns, key=_by_name)
+        data = {column.name: list(map(_column_value_extractor(column), runs)) for column in ordered_columns}
         columns_index = pd.Index([column.name for column in ordered_columns], name="attribute")
     else:
         data = {}
@@ -424,20 +431,25 @@ def _expected_dataframe(
 
     return pd.DataFrame(
         data=data,
-        index=pd.MultiIndex.from_tuples(
-            [(run.project_identifier, run.run_id) for run in runs],
+        index=pd.MultiIndex.from_arrays(
+            [[run.project_identifier for run in runs], [run.run_id for run in runs]],
             names=["project", "run"],
         ),
         columns=columns_index,
     )
 
 
-def _extract_column_value(run: IngestedRunData, column: Column) -> str | int | float:
+def _column_value_extractor(column: Column) -> Callable[[IngestedRunData], str | int | float]:
+    # Resolved once per column, so the name parsing and type dispatch don't repeat for every cell
     attribute_path = column.name.split(":", 1)[0]  # Remove type suffix if present
     if column.type == "config":
-        return run.configs.get(attribute_path, np.nan)
+        return lambda run: run.configs.get(attribute_path, np.nan)
     if column.type == "float_series":
-        if (series := run.float_series.get(attribute_path, None)) is not None:
-            return series[max(series)]  # Return the last value in the float series
-        return np.nan
+        return lambda run: _last_series_value(run.float_series.get(attribute_path, None))
     raise ValueError(f"Unsupported column type '{column.type}'.")
+
+
+def _last_series_value(series: dict[float, float] | None) -> float:
+    if series is not None:
+        return series[max(series)]  # Return the last value in the float series
+    return np.nan
@@ -84,21 +84,23 @@ def project(ensure_project: EnsureProjectFunction) -> IngestedProjectData:
 def experiment_identifiers(client, project):
     project_identifier = identifiers.ProjectIdentifier(project.project_identifier)
     experiment_names = [run.experiment_name for run in project.ingested_runs]
-    identifiers_by_name: list[identifiers.RunIdentifier] = []
 
-    for experiment_name in experiment_names:
-        sys_ids: list[identifiers.SysId] = []
-        for page in search.fetch_experiment_sys_ids(
-            client=client,
-            project_identifier=project_identifier,
-            filter_=_Filter.name_eq(experiment_name),
-        ):
-            sys_ids.extend(page.items)
+    # Resolve all experiments with a single query instead of one round-trip per name
+    sys_ids_by_name: dict[str, list[identifiers.SysId]] = {name: [] for name in experiment_names}
+    for page in search.fetch_experiment_sys_attrs(
+        client=client,
+        project_identifier=project_identifier,
+        filter_=_Filter.name_in(*experiment_names),
+    ):
+        for item in page.items:
+            sys_ids_by_name[item.sys_name].append(item.sys_id)
 
+    identifiers_by_name: list[identifiers.RunIdentifier] = []
+    for experiment_name, sys_ids in sys_ids_by_name.items():
         if len(sys_ids) != 1:
             raise RuntimeError(f"Expected to fetch exactly one sys_id for {experiment_name}, got {sys_ids}")
 
-        identifiers_by_name.append(identifiers.RunIdentifier(project_identifier, identifiers.SysId(sys_ids[0])))
+        identifiers_by_name.append(identifiers.RunIdentifier(project_identifier, sys_ids[0]))
 
     return identifiers_by_name
 
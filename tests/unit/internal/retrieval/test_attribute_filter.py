@@ -0,0 +1,29 @@
+from neptune_query.internal.filters import (
+    _AttributeFilter,
+    _AttributeNameFilter,
+)
+from neptune_query.internal.retrieval.attribute_filter import split_attribute_filters
+
+
+def _time_filter() -> _AttributeFilter:
+    return _AttributeFilter(
+        must_match_any=[_AttributeNameFilter(must_match_regexes=["sys/.*_time"])],
+        type_in=["datetime"],
+    )
+
+
+def test_split_attribute_filters_deduplicates_nested_alternatives():
+    attribute_filter = _time_filter()
+    for _ in range(10):
+        attribute_filter = _AttributeFilter.any([attribute_filter, _time_filter()])
+
+    assert split_attribute_filters(attribute_filter) == [_time_filter()]
+
+
+def test_split_attribute_filters_keeps_distinct_alternatives_in_order():
+    int_filter = _AttributeFilter(type_in=["int"])
+    float_filter = _AttributeFilter(type_in=["float"])
+
+    attribute_filter = _AttributeFilter.any([int_filter, float_filter, int_filter])
+
+    assert split_attribute_filters(attribute_filter) == [int_filter, float_filter]
@@ -0,0 +1,61 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import requests
+
+from neptune_query.internal.identifiers import ProjectIdentifier
+from neptune_query.internal.retrieval.files import (
+    SignedFile,
+    _download_file_requests,
+    _get_requests_session,
+)
+
+SIGNED_FILE = SignedFile(
+    url="https://storage.example.com/file",
+    path="path/to/file",
+    provider="gcp",
+    project_identifier=ProjectIdentifier("foo/bar"),
+    permission="read",
+)
+
+
+def _response(status_code: int, content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    response.close = mock.Mock(wraps=response.close)
+    return response
+
+
+def test_get_requests_session_is_reused_within_thread():
+    assert _get_requests_session() is _get_requests_session()
+
+
+def test_get_requests_session_is_separate_per_thread():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread_session = executor.submit(_get_requests_session).result()
+
+    assert other_thread_session is not _get_requests_session()
+
+
+def test_download_file_requests_writes_content_and_closes_response(tmp_path):
+    response = _response(200, b"content")
+    target_path = tmp_path / "file"
+
+    with mock.patch.object(_get_requests_session(), "get", return_value=response):
+        result = _download_file_requests(SIGNED_FILE, target_path)
+
+    assert result.status == "success"
+    assert target_path.read_bytes() == b"content"
+    response.close.assert_called_once()
+
+
+def test_download_file_requests_closes_response_on_http_error(tmp_path):
+    response = _response(404, b"missing")
+
+    with mock.patch.object(_get_requests_session(), "get", return_value=response):
+        result = _download_file_requests(SIGNED_FILE, tmp_path / "file")
+
+    assert (result.status, result.status_code, result.content) == ("not_found", 404, b"missing")
+    response.close.assert_called_once()
@@ -0,0 +1,68 @@
+from unittest import mock
+
+from neptune_query.generated.neptune_api.proto.neptune_pb.api.v1.model.series_values_pb2 import (
+    ProtoFloatSeriesValuesResponseDTO,
+)
+from neptune_query.internal.identifiers import (
+    AttributeDefinition,
+    ProjectIdentifier,
+    RunAttributeDefinition,
+    RunIdentifier,
+    SysId,
+)
+from neptune_query.internal.retrieval.metrics import (
+    _process_metrics_page,
+    fetch_multiple_series_values,
+)
+from neptune_query.internal.retrieval.search import ContainerType
+
+RUN_ATTRIBUTE = RunAttributeDefinition(
+    RunIdentifier(ProjectIdentifier("foo/bar"), SysId("sysid0")),
+    AttributeDefinition("path0", "float_series"),
+)
+
+
+def _response(request_id: str, steps: list[float]) -> ProtoFloatSeriesValuesResponseDTO:
+    response = ProtoFloatSeriesValuesResponseDTO()
+    series = response.series.add()
+    series.requestId = request_id
+    for step in steps:
+        point = series.series.values.add()
+        point.timestamp_millis = 1_000 + int(step)
+        point.step = step
+        point.value = step * 10
+        point.is_preview = step > 1
+        point.completion_ratio = 0.5 if step > 1 else 1.0
+    return response
+
+
+def test_process_metrics_page_extracts_float_point_values():
+    page = _process_metrics_page(_response("0", [3.0, 2.0, 1.0]), request_id_to_attribute={"0": RUN_ATTRIBUTE})
+
+    assert page.items == [
+        (
+            RUN_ATTRIBUTE,
+            [
+                (1_003, 3.0, 30.0, True, 0.5),
+                (1_002, 2.0, 20.0, True, 0.5),
+                (1_001, 1.0, 10.0, False, 1.0),
+            ],
+        )
+    ]
+
+
+def test_fetch_multiple_series_values_deduplicates_definitions():
+    with mock.patch(
+        "neptune_query.internal.retrieval.metrics._fetch_metrics_page", return_value=_response("0", [2.0, 1.0])
+    ) as fetch_page:
+        result = fetch_multiple_series_values(
+            client=mock.Mock(),
+            run_attribute_definitions=[RUN_ATTRIBUTE, RUN_ATTRIBUTE],
+            include_inherited=False,
+            container_type=ContainerType.RUN,
+            include_preview=False,
+        )
+
+    requests = fetch_page.call_args.args[1]["requests"]
+    assert [request["requestId"] for request in requests] == ["0"]
+    assert result == {RUN_ATTRIBUTE: [(1_001, 1.0, 10.0, False, 1.0), (1_002, 2.0, 20.0, True, 0.5)]}
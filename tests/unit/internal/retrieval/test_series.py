@@ -0,0 +1,55 @@
+from unittest import mock
+
+from neptune_query.generated.neptune_api.proto.neptune_pb.api.v1.model.series_values_pb2 import (
+    ProtoSeriesValuesResponseDTO,
+)
+from neptune_query.internal.identifiers import (
+    AttributeDefinition,
+    ProjectIdentifier,
+    RunAttributeDefinition,
+    RunIdentifier,
+    SysId,
+)
+from neptune_query.internal.retrieval.search import ContainerType
+from neptune_query.internal.retrieval.series import (
+    SeriesValue,
+    fetch_series_values,
+)
+
+RUN_ATTRIBUTE = RunAttributeDefinition(
+    RunIdentifier(ProjectIdentifier("foo/bar"), SysId("sysid0")),
+    AttributeDefinition("path0", "string_series"),
+)
+
+
+def _response(request_id: str, steps: list[float]) -> ProtoSeriesValuesResponseDTO:
+    response = ProtoSeriesValuesResponseDTO()
+    series = response.series.add()
+    series.requestId = request_id
+    for step in steps:
+        point = series.seriesValues.values.add()
+        point.timestamp_millis = 1_000 + int(step)
+        point.step = step
+        point.object.stringValue = f"value{step}"
+    return response
+
+
+def test_fetch_series_values_deduplicates_definitions():
+    with mock.patch(
+        "neptune_query.internal.retrieval.series._fetch_series_page", return_value=_response("0", [2.0, 1.0])
+    ) as fetch_page:
+        result = fetch_series_values(
+            client=mock.Mock(),
+            run_attribute_definitions=[RUN_ATTRIBUTE, RUN_ATTRIBUTE],
+            include_inherited=False,
+            container_type=ContainerType.RUN,
+        )
+
+    requests = fetch_page.call_args.args[1]["requests"]
+    assert [request["requestId"] for request in requests] == ["0"]
+    assert result == {
+        RUN_ATTRIBUTE: [
+            SeriesValue(1.0, "value1.0", timestamp_millis=1_001),
+            SeriesValue(2.0, "value2.0", timestamp_millis=1_002),
+        ]
+    }
@@ -107,6 +107,14 @@ def test_filter_operators(method, operator):
     assert filter_obj.value == value
 
 
+def test_filter_name_in():
+    assert _Filter.name_in("a").to_query() == _Filter.name_eq("a").to_query()
+    assert _Filter.name_in("a", "b").to_query() == '(`sys/name`:string == "a") OR (`sys/name`:string == "b")'
+
+    with pytest.raises(ValueError):
+        _Filter.name_in()
+
+
 def test_filter_with_attribute_object():
     # Test using Attribute object instead of string
     attr = _Attribute(name="test", type="string")
@@ -0,0 +1,34 @@
+import pickle
+
+from neptune_query.internal.identifiers import (
+    AttributeDefinition,
+    ProjectIdentifier,
+    RunAttributeDefinition,
+    RunIdentifier,
+    SysId,
+)
+
+
+def _run_attribute_definition(sys_id: str) -> RunAttributeDefinition:
+    return RunAttributeDefinition(
+        RunIdentifier(ProjectIdentifier("foo/bar"), SysId(sys_id)),
+        AttributeDefinition("path", "float_series"),
+    )
+
+
+def test_run_attribute_definition_hash_matches_equality():
+    assert _run_attribute_definition("sysid0") == _run_attribute_definition("sysid0")
+    assert hash(_run_attribute_definition("sysid0")) == hash(_run_attribute_definition("sysid0"))
+    assert _run_attribute_definition("sysid0") != _run_attribute_definition("sysid1")
+
+    lookup = {_run_attribute_definition("sysid0"): 0}
+    assert lookup[_run_attribute_definition("sysid0")] == 0
+
+
+def test_run_attribute_definition_pickle_round_trip():
+    definition = _run_attribute_definition("sysid0")
+
+    restored = pickle.loads(pickle.dumps(definition))
+
+    assert restored == definition
+    assert hash(restored) == hash(definition)